@@ -12,6 +12,11 @@ from .exceptions import ConfigValidationError
 from .models import ConfigFile
 from .types import ConfigurationSource, RawConfiguration, SourceType
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
@@ -58,24 +63,34 @@ class ConfigurationLoader:
         shared_path = guardian_dir / "config.yml"
         local_path = guardian_dir / "config.local.yml"
 
+        # One directory listing answers existence for both files; is_file() follows symlinks
+        try:
+            with os.scandir(guardian_dir) as entries:
+                file_names = {entry.name for entry in entries if entry.is_file()}
+        except (FileNotFoundError, NotADirectoryError):
+            file_names = set()
+        except OSError:
+            # Listing needs read permission on the directory while stat only needs search
+            # permission, so check each file directly and let any error from that propagate
+            file_names = {path.name for path in (shared_path, local_path) if path.is_file()}
+
         shared_source = ConfigurationSource(
-            source_type=SourceType.SHARED, path=shared_path, exists=shared_path.exists()
+            source_type=SourceType.SHARED, path=shared_path, exists=shared_path.name in file_names
         )
 
         local_source = ConfigurationSource(
-            source_type=SourceType.LOCAL, path=local_path, exists=local_path.exists()
+            source_type=SourceType.LOCAL, path=local_path, exists=local_path.name in file_names
         )
 
         return shared_source, local_source
 
-    def discover_all_sources(self) -> list[ConfigurationSource]:
+    def discover_all_sources(self) -> tuple[ConfigurationSource, ...]:
         """Discover all configuration sources in hierarchical order."""
-
-        default = self.find_default_config()
-        user = self.find_user_config()
-        shared, local = self.find_project_configs()
-
-        return [default, user, shared, local]
+        return (
+            self.find_default_config(),
+            self.find_user_config(),
+            *self.find_project_configs(),
+        )
 
     def load_yaml_file(self, source: ConfigurationSource) -> RawConfiguration | None:
         """
@@ -95,8 +110,12 @@ class ConfigurationLoader:
             return None
 
         try:
-            with open(source.path, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            if source.path.stat().st_size == 0:
+                logger.debug(f"Configuration file is empty: {source.path}")
+                return None
+
+            with source.path.open("rb") as f:
+                data = yaml.load(f, Loader=SafeLoader)
 
             if data is None:
                 # Empty YAML file - treat as no configuration
@@ -1,14 +1,61 @@
 """Configuration merging logic for hierarchical configuration sources."""
 
 import fnmatch
+import functools
 import logging
+import re
+from collections.abc import Callable
 
 from .exceptions import ConfigValidationError
 from .models import RuleConfigBase
-from .types import Configuration, RawConfiguration
+from .types import Configuration, RawConfiguration, SourceType
 
 logger = logging.getLogger(__name__)
 
+_GLOB_CHARS = frozenset("*?[")
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_default_rule_patterns(patterns: tuple[str, ...]) -> Callable[[str], bool]:
+    """
+    Compile default_rules glob patterns into a single rule ID matcher.
+
+    Literal patterns are matched by equality and 'prefix*' patterns with str.startswith,
+    so only the remaining globs go through a regex. Cached by pattern tuple so repeated
+    merges with the same setting reuse the matcher.
+
+    Args:
+        patterns: Non-empty tuple of glob patterns from the default_rules setting
+
+    Returns:
+        Function returning True for rule IDs that one of the glob patterns matches
+    """
+    exact: set[str] = set()
+    prefixes: list[str] = []
+    globs: list[str] = []
+
+    for pattern in patterns:
+        if not _GLOB_CHARS.intersection(pattern):
+            exact.add(pattern)
+        elif pattern.endswith("*") and not _GLOB_CHARS.intersection(pattern[:-1]):
+            prefixes.append(pattern[:-1])
+        else:
+            globs.append(pattern)
+
+    prefix_tuple = tuple(prefixes)
+    glob_regex = (
+        re.compile("|".join(fnmatch.translate(pattern) for pattern in globs)) if globs else None
+    )
+
+    def matches(rule_id: str) -> bool:
+        return (
+            rule_id in exact
+            or rule_id.startswith(prefix_tuple)
+            or (glob_regex is not None and glob_regex.match(rule_id) is not None)
+        )
+
+    return matches
+
 
 class ConfigurationMerger:
     """Merges multiple configuration sources into a single configuration."""
@@ -29,17 +76,28 @@ class ConfigurationMerger:
         if not raw_configs:
             return Configuration()
 
+        # The same file can be reached through two sources (e.g. a user config directory
+        # pointing at the project's .claude/guardian); merging it again changes nothing
+        seen_paths = set()
+        unique_configs = []
+        for raw_config in raw_configs:
+            if raw_config.source.path in seen_paths:
+                logger.debug(f"Skipping duplicate configuration source: {raw_config.source.path}")
+                continue
+            seen_paths.add(raw_config.source.path)
+            unique_configs.append(raw_config)
+
         # Collect sources and the final default_rules setting
         sources = []
         final_default_rules: bool | list[str] = True  # Default value
 
-        for raw_config in raw_configs:
+        for raw_config in unique_configs:
             sources.append(raw_config.source)
             # Later configs override default_rules setting
             if raw_config.data.default_rules is not None:
                 final_default_rules = raw_config.data.default_rules
 
-        merged_rules_data = self._merge_rules_by_id(raw_configs, final_default_rules)
+        merged_rules_data = self._merge_rules_by_id(unique_configs, final_default_rules)
 
         rules = [
             rule_config.to_rule(rule_id) for rule_id, rule_config in merged_rules_data.items()
@@ -74,7 +132,15 @@ class ConfigurationMerger:
         """
         merged_rules: dict[str, RuleConfigBase] = {}
 
+        default_rules_filter: bool | Callable[[str], bool] = (
+            _compile_default_rule_patterns(tuple(default_rules_setting))
+            if isinstance(default_rules_setting, list) and default_rules_setting
+            else bool(default_rules_setting)
+        )
+
         for raw_config in raw_configs:
+            is_default_source = raw_config.source.source_type == SourceType.DEFAULT
+
             for rule_id, rule_config in raw_config.data.rules.items():
                 if rule_id not in merged_rules:
                     # First occurrence - must be complete RuleConfigBase instance
@@ -86,12 +152,12 @@ class ConfigurationMerger:
                         )
 
                     # For default rules, set enabled based on default_rules_setting
-                    if raw_config.source.source_type.value == "default":
+                    if is_default_source and rule_config.enabled is None:
                         should_enable = self._should_enable_default_rule(
-                            rule_id, default_rules_setting
+                            rule_id, default_rules_filter
                         )
-                        if rule_config.enabled is None:
-                            rule_config.enabled = should_enable
+                        # Rule configs are frozen, so enable or disable a copy
+                        rule_config = rule_config.model_copy(update={"enabled": should_enable})
 
                     merged_rules[rule_id] = rule_config
                 else:
@@ -121,27 +187,19 @@ class ConfigurationMerger:
         return merged_rules
 
     def _should_enable_default_rule(
-        self, rule_id: str, default_rules_setting: bool | list[str]
+        self, rule_id: str, default_rules_filter: bool | Callable[[str], bool]
     ) -> bool:
         """
         Check if a default rule should be enabled based on filtering settings.
 
         Args:
             rule_id: Rule identifier to check
-            default_rules_setting: Default rules setting (True=all, False=none, list=patterns)
+            default_rules_filter: True=all, False=none, function=compiled default_rules matcher
 
         Returns:
             True if rule should be enabled
         """
-        if default_rules_setting is False:
-            return False
-
-        if default_rules_setting is True:
-            return True
-
-        # default_rules_setting is a list of patterns
-        for pattern in default_rules_setting:
-            if fnmatch.fnmatch(rule_id, pattern):
-                return True
+        if isinstance(default_rules_filter, bool):
+            return default_rules_filter
 
-        return False
+        return default_rules_filter(rule_id)
@@ -5,7 +5,14 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    ValidationError,
+    field_validator,
+    model_validator,
+)
 
 from ..rules import (
     Action,
@@ -88,6 +95,8 @@ def _validate_glob_pattern(pattern: str) -> None:
 class CommandPatternModel(BaseModel):
     """Pattern definition for bash command rules."""
 
+    model_config = ConfigDict(frozen=True)
+
     pattern: str
     action: Action | None = None
     message: str | None = None
@@ -103,6 +112,8 @@ class CommandPatternModel(BaseModel):
 class PathPatternModel(BaseModel):
     """Pattern definition for path access rules."""
 
+    model_config = ConfigDict(frozen=True)
+
     pattern: str
     scope: Scope | None = None
     action: Action | None = None
@@ -119,6 +130,8 @@ class PathPatternModel(BaseModel):
 class RuleConfigBase(BaseModel, ABC):
     """Base class for all rule configurations."""
 
+    model_config = ConfigDict(frozen=True)
+
     type: str
     enabled: bool | None = None
     priority: int | None = None
@@ -200,6 +213,20 @@ class PreUseBashRuleConfig(RuleConfigBase):
     pattern: str | None = None
     commands: list[CommandPatternModel] | None = None
 
+    @model_validator(mode="before")
+    @classmethod
+    def convert_pattern_to_commands(cls, data: Any) -> Any:
+        """Convert single pattern to commands list for internal consistency."""
+        if not isinstance(data, dict) or data.get("commands") is not None:
+            return data
+
+        pattern = data.get("pattern")
+        if not pattern or not isinstance(pattern, str):
+            return data
+
+        _validate_regex_pattern(pattern)
+        return {**data, "pattern": None, "commands": [{"pattern": pattern}]}
+
     @model_validator(mode="after")
     def validate_pattern_or_commands(self) -> "PreUseBashRuleConfig":
         """Ensure exactly one of pattern or commands is provided."""
@@ -214,13 +241,6 @@ class PreUseBashRuleConfig(RuleConfigBase):
                 "Cannot specify both 'pattern' and 'commands' fields - they are mutually exclusive"
             )
 
-        # Convert single pattern to commands list for internal consistency
-        if has_pattern and self.pattern:
-            _validate_regex_pattern(self.pattern)
-
-            self.commands = [CommandPatternModel(pattern=self.pattern, action=None, message=None)]
-            self.pattern = None  # Clear the pattern field
-
         if self.commands is not None and len(self.commands) == 0:
             raise ValueError("'commands' field cannot be empty")
 
@@ -286,6 +306,20 @@ class PathAccessRuleConfig(RuleConfigBase):
     pattern: str | None = None
     paths: list[PathPatternModel] | None = None
 
+    @model_validator(mode="before")
+    @classmethod
+    def convert_pattern_to_paths(cls, data: Any) -> Any:
+        """Convert single pattern to paths list for internal consistency."""
+        if not isinstance(data, dict) or data.get("paths") is not None:
+            return data
+
+        pattern = data.get("pattern")
+        if not pattern or not isinstance(pattern, str):
+            return data
+
+        _validate_glob_pattern(pattern)
+        return {**data, "pattern": None, "paths": [{"pattern": pattern}]}
+
     @model_validator(mode="after")
     def validate_pattern_or_paths(self) -> "PathAccessRuleConfig":
         """Ensure exactly one of pattern or paths is provided."""
@@ -300,15 +334,6 @@ class PathAccessRuleConfig(RuleConfigBase):
                 "Cannot specify both 'pattern' and 'paths' fields - they are mutually exclusive"
             )
 
-        # Convert single pattern to paths list for internal consistency
-        if has_pattern and self.pattern:
-            _validate_glob_pattern(self.pattern)
-
-            self.paths = [
-                PathPatternModel(pattern=self.pattern, scope=None, action=None, message=None)
-            ]
-            self.pattern = None  # Clear the pattern field
-
         if self.paths is not None and len(self.paths) == 0:
             raise ValueError("'paths' field cannot be empty")
 
@@ -388,6 +413,8 @@ RULE_TYPE_MODELS = {
 class ConfigFile(BaseModel):
     """Top-level configuration file structure."""
 
+    model_config = ConfigDict(frozen=True)
+
     default_rules: bool | list[str] | None = None
     rules: dict[str, RuleConfigUnion] = Field(default_factory=dict)
 
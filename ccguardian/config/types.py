@@ -17,7 +17,7 @@ class SourceType(Enum):
     LOCAL = "local"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ConfigurationSource:
     """Represents a configuration source (file location and metadata)."""
 
@@ -36,7 +36,7 @@ class ConfigurationSource:
         }[self.source_type]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RawConfiguration:
     """Raw configuration data loaded from YAML before processing."""
 
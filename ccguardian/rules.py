@@ -1,8 +1,9 @@
+import os
 import re
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from fnmatch import fnmatch
+from fnmatch import translate
 from pathlib import Path
 
 from cchooks import HookContext, PostToolUseContext, PreToolUseContext
@@ -25,7 +26,7 @@ class Scope(Enum):
     READ_WRITE = "read_write"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RuleResult:
     rule_id: str
     action: Action
@@ -33,22 +34,33 @@ class RuleResult:
     matched_pattern: str | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CommandPattern:
     pattern: str
     action: Action | None = None
     message: str | None = None
+    regex: re.Pattern[str] = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self):
+        object.__setattr__(self, "regex", re.compile(self.pattern))
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class PathPattern:
     pattern: str
     scope: Scope | None = None
     action: Action | None = None
     message: str | None = None
+    regex: re.Pattern[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Same translation fnmatch applies on every call, done once per pattern
+        object.__setattr__(self, "regex", re.compile(translate(os.path.normcase(self.pattern))))
 
 
 class Rule(ABC):
+    __slots__ = ("id", "enabled", "priority", "action", "message")
+
     hook_map: dict[str, set[str]]
     type: str
 
@@ -87,6 +99,8 @@ class Rule(ABC):
 
 
 class PreUseBashRule(Rule):
+    __slots__ = ("commands",)
+
     type = "pre_use_bash"
     hook_map = {"PreToolUse": {"Bash"}}
     default_action = Action.CONTINUE
@@ -116,7 +130,7 @@ class PreUseBashRule(Rule):
             return None
 
         for pattern in self.commands:
-            if re.search(pattern.pattern, command):
+            if pattern.regex.search(command):
                 action = pattern.action or self.action
                 message = (
                     pattern.message
@@ -135,6 +149,8 @@ class PreUseBashRule(Rule):
 
 
 class PathAccessRule(Rule):
+    __slots__ = ("paths", "scope")
+
     type = "path_access"
     hook_map = {"PreToolUse": {"Read", "Edit", "MultiEdit", "Write"}}
     default_action = Action.DENY
@@ -167,9 +183,12 @@ class PathAccessRule(Rule):
             return None
 
         operation_scope = self._get_operation_scope(context.tool_name)
+        path = Path(file_path)
+        full_path = os.path.normcase(str(path))
+        name = os.path.normcase(path.name)
 
         for pattern in self.paths:
-            if self._path_matches_pattern(file_path, pattern.pattern):
+            if self._path_matches_pattern(full_path, name, pattern):
                 # Check if the pattern scope applies to this operation
                 pattern_scope = pattern.scope or self.scope
                 if not self._scope_applies(pattern_scope, operation_scope):
@@ -195,15 +214,12 @@ class PathAccessRule(Rule):
         else:  # Edit, MultiEdit, Write
             return Scope.WRITE
 
-    def _path_matches_pattern(self, file_path: str, pattern: str) -> bool:
-        path = Path(file_path)
-
-        # Handle absolute patterns
-        if pattern.startswith("/"):
-            return fnmatch(str(path), pattern)
+    def _path_matches_pattern(self, full_path: str, name: str, pattern: PathPattern) -> bool:
+        if pattern.regex.match(full_path):
+            return True
 
-        # Handle relative patterns - check against the full path and just the filename/relative parts
-        return fnmatch(str(path), pattern) or fnmatch(path.name, pattern)
+        # Relative patterns also match against just the filename, absolute ones never do
+        return not pattern.pattern.startswith("/") and pattern.regex.match(name) is not None
 
     def _scope_applies(self, pattern_scope: Scope, operation_scope: Scope) -> bool:
         if pattern_scope == Scope.READ_WRITE:
@@ -0,0 +1,107 @@
+"""Micro-benchmarks for rule evaluation hot paths.
+
+Run with: uv run python scripts/benchmark.py [--group NAME] [--number N] [--repeat N]
+
+Rule groups use non-matching inputs so every pattern is tried (worst case). The engine
+group evaluates the active rules of the configuration found for the current environment.
+"""
+
+import argparse
+import timeit
+
+from cchooks import PreToolUseContext
+
+from ccguardian.config import ConfigurationManager
+from ccguardian.engine import Engine
+from ccguardian.rules import CommandPattern, PathAccessRule, PathPattern, PreUseBashRule
+
+PATTERN_COUNT = 100
+NUMBER = 1000
+REPEAT = 5
+WARMUP = 100
+GROUPS = ("bash-rule", "path-rule", "engine")
+
+
+def pre_use_context(tool_name: str, **tool_input) -> PreToolUseContext:
+    return PreToolUseContext(
+        {
+            "session_id": "benchmark",
+            "transcript_path": "/tmp/benchmark.jsonl",
+            "hook_event_name": "PreToolUse",
+            "cwd": "/tmp",
+            "tool_name": tool_name,
+            "tool_input": tool_input,
+        }
+    )
+
+
+def bench(name: str, func, *args, number: int = NUMBER, repeat: int = REPEAT) -> None:
+    for _ in range(WARMUP):
+        func(*args)
+
+    # timeit disables garbage collection while timing
+    timings = timeit.repeat(lambda: func(*args), number=number, repeat=repeat)
+    per_call_us = min(timings) / number * 1_000_000
+    print(f"{name:<48} {per_call_us:10.2f} us/call")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=NUMBER, help="calls per timing run")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="timing runs per benchmark")
+    parser.add_argument(
+        "--group",
+        action="append",
+        choices=GROUPS,
+        help="benchmark group to run, may be repeated (default: all)",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    groups = args.group or GROUPS
+
+    bash_rule = PreUseBashRule(
+        id="benchmark.bash",
+        commands=[CommandPattern(pattern=rf"^command{i}\b") for i in range(PATTERN_COUNT)],
+    )
+    path_rule = PathAccessRule(
+        id="benchmark.path",
+        paths=[PathPattern(pattern=f"**/secret{i}/*.env") for i in range(PATTERN_COUNT)],
+    )
+
+    bash_context = pre_use_context("Bash", command="grep -r TODO src")
+    read_context = pre_use_context("Read", file_path="/home/user/project/src/main.py")
+
+    benchmarks = {
+        "bash-rule": [
+            (
+                f"PreUseBashRule.evaluate ({PATTERN_COUNT} patterns)",
+                bash_rule.evaluate,
+                bash_context,
+            ),
+        ],
+        "path-rule": [
+            (
+                f"PathAccessRule.evaluate ({PATTERN_COUNT} patterns)",
+                path_rule.evaluate,
+                read_context,
+            ),
+        ],
+    }
+    if "engine" in groups:
+        active_rules = ConfigurationManager().load_configuration().active_rules
+        benchmarks["engine"] = [
+            ("Engine.evaluate_rules (Bash)", Engine(bash_context).evaluate_rules, active_rules),
+            ("Engine.evaluate_rules (Read)", Engine(read_context).evaluate_rules, active_rules),
+        ]
+
+    for group in groups:
+        print(f"[{group}]")
+        for name, func, arg in benchmarks[group]:
+            bench(name, func, arg, number=args.number, repeat=args.repeat)
+
+
+if __name__ == "__main__":
+    main()
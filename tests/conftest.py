@@ -28,6 +28,13 @@ def mock_config_manager():
     return mock_manager
 
 
+@pytest.fixture
+def clean_env(monkeypatch):
+    for name in ("CLAUDE_PROJECT_DIR", "CLAUDE_CODE_GUARDIAN_CONFIG", "XDG_CONFIG_HOME"):
+        monkeypatch.delenv(name, raising=False)
+    return monkeypatch
+
+
 @pytest.fixture
 def temp_config_dir():
     with tempfile.TemporaryDirectory() as tmpdir:
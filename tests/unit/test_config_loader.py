@@ -1,12 +1,10 @@
 """Tests for configuration loading functionality."""
 
-import os
-import tempfile
+import json
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import Mock, patch
 
 import pytest
-import yaml
 
 from ccguardian.config import (
     ConfigFile,
@@ -15,100 +13,153 @@ from ccguardian.config import (
     ConfigValidationError,
     SourceType,
 )
+from tests.utils import create_yaml_config
 
 
-class TestConfigurationLoader:
-    def setup_method(self):
-        self.loader = ConfigurationLoader()
+@pytest.fixture(scope="module")
+def loader():
+    return ConfigurationLoader()
+
 
-    def test_find_default_config(self):
-        source = self.loader.find_default_config()
+class TestConfigurationLoader:
+    def test_find_default_config(self, loader):
+        source = loader.find_default_config()
 
         assert source.source_type == SourceType.DEFAULT
         assert source.path.name == "default.yml"
         assert source.path.parent.name == "config"
         assert source.exists
 
-    @patch.dict(os.environ, {}, clear=True)
-    def test_find_user_config_default_location(self):
-        source = self.loader.find_user_config()
+    def test_find_user_config_default_location(self, loader, clean_env):
+        source = loader.find_user_config()
 
         assert source.source_type == SourceType.USER
         expected_path = Path.home() / ".config" / "claude-code-guardian" / "config.yml"
         assert source.path == expected_path
         assert source.exists == expected_path.exists()
 
-    @patch.dict(os.environ, {"CLAUDE_CODE_GUARDIAN_CONFIG": "/custom/config/path"}, clear=True)
-    def test_find_user_config_environment_override(self):
-        source = self.loader.find_user_config()
+    def test_find_user_config_environment_override(self, loader, clean_env):
+        clean_env.setenv("CLAUDE_CODE_GUARDIAN_CONFIG", "/custom/config/path")
+        source = loader.find_user_config()
 
         assert source.source_type == SourceType.USER
         expected_path = Path("/custom/config/path") / "config.yml"
         assert source.path == expected_path
         assert source.exists == expected_path.exists()
 
-    @patch.dict(os.environ, {}, clear=True)
-    def test_find_project_configs_not_found_cwd(self):
+    def test_find_project_configs_not_found_cwd(self, loader, tmp_path, clean_env):
         """Test finding project configs when .claude/guardian doesn't exist (using cwd)."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with patch("ccguardian.config.loader.Path.cwd", return_value=Path(tmpdir)):
-                shared, local = self.loader.find_project_configs()
+        with patch("ccguardian.config.loader.Path.cwd", return_value=tmp_path):
+            shared, local = loader.find_project_configs()
 
-                assert shared.source_type == SourceType.SHARED
-                assert local.source_type == SourceType.LOCAL
-                assert not shared.exists
-                assert not local.exists
+        assert shared.source_type == SourceType.SHARED
+        assert local.source_type == SourceType.LOCAL
+        assert not shared.exists
+        assert not local.exists
 
-                expected_dir = Path(tmpdir) / ".claude" / "guardian"
-                assert shared.path == expected_dir / "config.yml"
-                assert local.path == expected_dir / "config.local.yml"
+        expected_dir = tmp_path / ".claude" / "guardian"
+        assert shared.path == expected_dir / "config.yml"
+        assert local.path == expected_dir / "config.local.yml"
 
-    @patch.dict(os.environ, {"CLAUDE_PROJECT_DIR": "/project/root"}, clear=True)
-    def test_find_project_configs_env_var_nonexistent_dir(self):
+    def test_find_project_configs_env_var_nonexistent_dir(self, loader, clean_env):
         """Test finding project configs when CLAUDE_PROJECT_DIR points to nonexistent directory."""
+        clean_env.setenv("CLAUDE_PROJECT_DIR", "/project/root")
         with pytest.raises(
             ConfigValidationError, match="CLAUDE_PROJECT_DIR directory does not exist"
         ):
-            self.loader.find_project_configs()
+            loader.find_project_configs()
 
-    def test_find_project_configs_env_var_no_guardian_dir(self):
+    def test_find_project_configs_env_var_no_guardian_dir(self, loader, tmp_path, clean_env):
         """Test finding project configs when CLAUDE_PROJECT_DIR exists but .claude/guardian doesn't."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with patch.dict(os.environ, {"CLAUDE_PROJECT_DIR": tmpdir}, clear=True):
-                shared, local = self.loader.find_project_configs()
+        clean_env.setenv("CLAUDE_PROJECT_DIR", str(tmp_path))
+        shared, local = loader.find_project_configs()
 
-                assert shared.source_type == SourceType.SHARED
-                assert local.source_type == SourceType.LOCAL
-                assert not shared.exists
-                assert not local.exists
+        assert shared.source_type == SourceType.SHARED
+        assert local.source_type == SourceType.LOCAL
+        assert not shared.exists
+        assert not local.exists
 
-                expected_dir = Path(tmpdir) / ".claude" / "guardian"
-                assert shared.path == expected_dir / "config.yml"
-                assert local.path == expected_dir / "config.local.yml"
+        expected_dir = tmp_path / ".claude" / "guardian"
+        assert shared.path == expected_dir / "config.yml"
+        assert local.path == expected_dir / "config.local.yml"
 
-    def test_find_project_configs_found_env_var(self):
+    def test_find_project_configs_found_env_var(self, loader, tmp_path, clean_env):
         """Test finding project configs using CLAUDE_PROJECT_DIR when .claude/guardian exists."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create .claude/guardian directory structure
-            guardian_dir = Path(tmpdir) / ".claude" / "guardian"
-            guardian_dir.mkdir(parents=True)
+        # Create .claude/guardian directory structure
+        guardian_dir = tmp_path / ".claude" / "guardian"
+        guardian_dir.mkdir(parents=True)
+
+        # Create config files
+        shared_path = guardian_dir / "config.yml"
+        local_path = guardian_dir / "config.local.yml"
+        shared_path.write_text("# shared config")
+        local_path.write_text("# local config")
+
+        clean_env.setenv("CLAUDE_PROJECT_DIR", str(tmp_path))
+        shared, local = loader.find_project_configs()
+
+        assert shared.exists
+        assert local.exists
+        assert shared.path == shared_path
+        assert local.path == local_path
+
+    def test_find_project_configs_only_shared_exists(self, loader, tmp_path, clean_env):
+        guardian_dir = tmp_path / ".claude" / "guardian"
+        guardian_dir.mkdir(parents=True)
+        (guardian_dir / "config.yml").write_text("# shared config")
+
+        clean_env.setenv("CLAUDE_PROJECT_DIR", str(tmp_path))
+        shared, local = loader.find_project_configs()
+
+        assert shared.exists
+        assert not local.exists
+
+    def test_find_project_configs_dangling_symlink(self, loader, tmp_path, clean_env):
+        guardian_dir = tmp_path / ".claude" / "guardian"
+        guardian_dir.mkdir(parents=True)
+        (guardian_dir / "config.yml").symlink_to(tmp_path / "missing.yml")
+
+        clean_env.setenv("CLAUDE_PROJECT_DIR", str(tmp_path))
+        shared, local = loader.find_project_configs()
+
+        assert not shared.exists
+        assert not local.exists
+
+    def test_find_project_configs_guardian_path_is_file(self, loader, tmp_path, clean_env):
+        (tmp_path / ".claude").mkdir()
+        (tmp_path / ".claude" / "guardian").write_text("not a directory")
+
+        clean_env.setenv("CLAUDE_PROJECT_DIR", str(tmp_path))
+        shared, local = loader.find_project_configs()
+
+        assert not shared.exists
+        assert not local.exists
 
-            # Create config files
-            shared_path = guardian_dir / "config.yml"
-            local_path = guardian_dir / "config.local.yml"
-            shared_path.write_text("# shared config")
-            local_path.write_text("# local config")
+    def test_find_project_configs_unlistable_dir_checks_files(self, loader, tmp_path, clean_env):
+        guardian_dir = tmp_path / ".claude" / "guardian"
+        guardian_dir.mkdir(parents=True)
+        (guardian_dir / "config.yml").write_text("# shared config")
 
-            with patch.dict(os.environ, {"CLAUDE_PROJECT_DIR": tmpdir}, clear=True):
-                shared, local = self.loader.find_project_configs()
+        clean_env.setenv("CLAUDE_PROJECT_DIR", str(tmp_path))
+        with patch("ccguardian.config.loader.os.scandir", side_effect=PermissionError):
+            shared, local = loader.find_project_configs()
 
-                assert shared.exists
-                assert local.exists
-                assert shared.path == shared_path
-                assert local.path == local_path
+        assert shared.exists
+        assert not local.exists
 
-    def test_discover_all_sources(self):
-        sources = self.loader.discover_all_sources()
+    def test_find_project_configs_unreadable_dir_raises(self, loader, tmp_path, clean_env):
+        (tmp_path / ".claude" / "guardian").mkdir(parents=True)
+
+        clean_env.setenv("CLAUDE_PROJECT_DIR", str(tmp_path))
+        with (
+            patch("ccguardian.config.loader.os.scandir", side_effect=PermissionError),
+            patch("ccguardian.config.loader.Path.is_file", side_effect=PermissionError),
+            pytest.raises(PermissionError),
+        ):
+            loader.find_project_configs()
+
+    def test_discover_all_sources(self, loader, clean_env):
+        sources = loader.discover_all_sources()
 
         assert len(sources) == 4
         assert sources[0].source_type == SourceType.DEFAULT
@@ -116,109 +167,92 @@ class TestConfigurationLoader:
         assert sources[2].source_type == SourceType.SHARED
         assert sources[3].source_type == SourceType.LOCAL
 
-    def test_load_yaml_file_success(self):
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-            yaml.dump(
-                {
-                    "default_rules": True,
-                    "rules": {
-                        "test.rule": {"type": "pre_use_bash", "pattern": "test", "enabled": True}
-                    },
+    def test_load_yaml_file_success(self, loader, tmp_path):
+        config_path = create_yaml_config(
+            tmp_path,
+            "config.yml",
+            {
+                "default_rules": True,
+                "rules": {
+                    "test.rule": {"type": "pre_use_bash", "pattern": "test", "enabled": True}
                 },
-                f,
-            )
-            temp_path = Path(f.name)
-
-        try:
-            source = ConfigurationSource(source_type=SourceType.USER, path=temp_path, exists=True)
+            },
+        )
+        source = ConfigurationSource(source_type=SourceType.USER, path=config_path, exists=True)
 
-            result = self.loader.load_yaml_file(source)
+        result = loader.load_yaml_file(source)
 
-            assert result is not None
-            assert result.source == source
-            assert isinstance(result.data, ConfigFile)
-            assert result.data.default_rules is True
-            assert len(result.data.rules) == 1
-            assert "test.rule" in result.data.rules
-        finally:
-            temp_path.unlink()
+        assert result is not None
+        assert result.source == source
+        assert isinstance(result.data, ConfigFile)
+        assert result.data.default_rules is True
+        assert len(result.data.rules) == 1
+        assert "test.rule" in result.data.rules
 
-    def test_load_yaml_file_not_exists(self):
+    def test_load_yaml_file_not_exists(self, loader):
         source = ConfigurationSource(
             source_type=SourceType.USER, path=Path("/nonexistent/config.yml"), exists=False
         )
 
-        result = self.loader.load_yaml_file(source)
+        result = loader.load_yaml_file(source)
         assert result is None
 
-    def test_load_yaml_file_empty(self):
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-            f.write("")  # Empty file
-            temp_path = Path(f.name)
-
-        try:
-            source = ConfigurationSource(source_type=SourceType.USER, path=temp_path, exists=True)
+    def test_load_yaml_file_empty(self, loader, tmp_path):
+        config_path = tmp_path / "config.yml"
+        config_path.write_text("")
+        source = ConfigurationSource(source_type=SourceType.USER, path=config_path, exists=True)
 
-            result = self.loader.load_yaml_file(source)
-            assert result is None
-        finally:
-            temp_path.unlink()
+        result = loader.load_yaml_file(source)
+        assert result is None
 
-    def test_load_yaml_file_invalid_yaml(self):
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-            f.write("invalid: yaml: content: [unclosed")
-            temp_path = Path(f.name)
+    def test_load_yaml_file_only_comments(self, loader, tmp_path):
+        config_path = tmp_path / "config.yml"
+        config_path.write_text("# nothing configured yet\n")
+        source = ConfigurationSource(source_type=SourceType.USER, path=config_path, exists=True)
 
-        try:
-            source = ConfigurationSource(source_type=SourceType.USER, path=temp_path, exists=True)
+        result = loader.load_yaml_file(source)
+        assert result is None
 
-            with pytest.raises(ConfigValidationError, match="Invalid YAML syntax"):
-                self.loader.load_yaml_file(source)
-        finally:
-            temp_path.unlink()
+    def test_load_yaml_file_invalid_yaml(self, loader, tmp_path):
+        config_path = tmp_path / "config.yml"
+        config_path.write_text("invalid: yaml: content: [unclosed")
+        source = ConfigurationSource(source_type=SourceType.USER, path=config_path, exists=True)
 
-    def test_load_yaml_file_not_dict(self):
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-            yaml.dump(["list", "instead", "of", "dict"], f)
-            temp_path = Path(f.name)
+        with pytest.raises(ConfigValidationError, match="Invalid YAML syntax"):
+            loader.load_yaml_file(source)
 
-        try:
-            source = ConfigurationSource(source_type=SourceType.USER, path=temp_path, exists=True)
+    def test_load_yaml_file_not_dict(self, loader, tmp_path):
+        config_path = tmp_path / "config.yml"
+        config_path.write_text(json.dumps(["list", "instead", "of", "dict"]))
+        source = ConfigurationSource(source_type=SourceType.USER, path=config_path, exists=True)
 
-            with pytest.raises(
-                ConfigValidationError, match="Configuration file must contain a YAML object"
-            ):
-                self.loader.load_yaml_file(source)
-        finally:
-            temp_path.unlink()
+        with pytest.raises(
+            ConfigValidationError, match="Configuration file must contain a YAML object"
+        ):
+            loader.load_yaml_file(source)
 
-    def test_load_yaml_file_invalid_configuration(self):
+    def test_load_yaml_file_invalid_configuration(self, loader, tmp_path):
         """Test Pydantic validation error for invalid configuration."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-            yaml.dump(
-                {
-                    "rules": {
-                        "test.rule": {
-                            "type": "invalid_type",  # Invalid rule type
-                            "pattern": "test",
-                        }
+        config_path = create_yaml_config(
+            tmp_path,
+            "config.yml",
+            {
+                "rules": {
+                    "test.rule": {
+                        "type": "invalid_type",  # Invalid rule type
+                        "pattern": "test",
                     }
-                },
-                f,
-            )
-            temp_path = Path(f.name)
-
-        try:
-            source = ConfigurationSource(source_type=SourceType.USER, path=temp_path, exists=True)
+                }
+            },
+        )
+        source = ConfigurationSource(source_type=SourceType.USER, path=config_path, exists=True)
 
-            with pytest.raises(ConfigValidationError, match="Configuration validation failed"):
-                self.loader.load_yaml_file(source)
-        finally:
-            temp_path.unlink()
+        with pytest.raises(ConfigValidationError, match="Configuration validation failed"):
+            loader.load_yaml_file(source)
 
-    def test_load_all_configurations(self):
-        with patch.object(self.loader, "discover_all_sources") as mock_discover:
-            with patch.object(self.loader, "load_yaml_file") as mock_load:
+    def test_load_all_configurations(self, loader):
+        with patch.object(loader, "discover_all_sources") as mock_discover:
+            with patch.object(loader, "load_yaml_file") as mock_load:
                 # Mock sources
                 sources = [
                     ConfigurationSource(SourceType.DEFAULT, Path("/default.yml"), True),
@@ -237,55 +271,48 @@ class TestConfigurationLoader:
 
                 mock_load.side_effect = mock_load_side_effect
 
-                result = self.loader.load_all_configurations()
+                result = loader.load_all_configurations()
 
                 # Should only get configs that exist (None configs are filtered out)
                 assert len(result) == 2
                 assert result[0].source.source_type == SourceType.DEFAULT
                 assert result[1].source.source_type == SourceType.SHARED
 
-    def test_validate_project_dir_valid(self, temp_config_dir):
+    def test_validate_project_dir_valid(self, loader, temp_config_dir):
         # Valid absolute path
-        result = self.loader._validate_project_dir(str(temp_config_dir))
+        result = loader._validate_project_dir(str(temp_config_dir))
         assert result == temp_config_dir.resolve()
 
-    def test_validate_project_dir_invalid_relative(self):
+    def test_validate_project_dir_invalid_relative(self, loader):
         with pytest.raises(ConfigValidationError, match="must be an absolute path"):
-            self.loader._validate_project_dir("relative/path")
+            loader._validate_project_dir("relative/path")
 
-    def test_validate_project_dir_invalid_traversal(self):
+    def test_validate_project_dir_invalid_traversal(self, loader):
         with pytest.raises(
             ConfigValidationError, match="cannot contain '\\.\\.' path components"
         ):
-            self.loader._validate_project_dir("/some/path/../../../etc")
-
-    def test_validate_project_dir_resolve_error(self):
-        mock_path = MagicMock()
-        mock_path.expanduser.return_value = mock_path
-        mock_path.is_absolute.return_value = True
-        mock_path.parts = ["/", "valid", "path"]
-        mock_path.resolve.side_effect = OSError("Mock resolve error")
+            loader._validate_project_dir("/some/path/../../../etc")
 
-        with patch("ccguardian.config.loader.Path", return_value=mock_path):
-            with pytest.raises(ConfigValidationError, match="Invalid CLAUDE_PROJECT_DIR path"):
-                self.loader._validate_project_dir("/valid/path")
+    def test_validate_project_dir_resolve_error(self, loader):
+        with pytest.raises(ConfigValidationError, match="Invalid CLAUDE_PROJECT_DIR path"):
+            loader._validate_project_dir("/valid/pa\x00th")
 
-    def test_validate_project_dir_not_exists(self):
+    def test_validate_project_dir_not_exists(self, loader):
         with pytest.raises(
             ConfigValidationError, match="CLAUDE_PROJECT_DIR directory does not exist"
         ):
-            self.loader._validate_project_dir("/nonexistent/directory")
+            loader._validate_project_dir("/nonexistent/directory")
 
-    def test_validate_config_dir_valid(self, temp_config_dir):
-        result = self.loader._validate_config_dir(str(temp_config_dir), "TEST_VAR")
+    def test_validate_config_dir_valid(self, loader, temp_config_dir):
+        result = loader._validate_config_dir(str(temp_config_dir), "TEST_VAR")
         assert result == temp_config_dir.resolve()
 
-    def test_validate_config_dir_invalid_relative(self):
+    def test_validate_config_dir_invalid_relative(self, loader):
         with pytest.raises(ConfigValidationError, match="TEST_VAR must be an absolute path"):
-            self.loader._validate_config_dir("relative/path", "TEST_VAR")
+            loader._validate_config_dir("relative/path", "TEST_VAR")
 
-    def test_validate_config_dir_invalid_traversal(self):
+    def test_validate_config_dir_invalid_traversal(self, loader):
         with pytest.raises(
             ConfigValidationError, match="cannot contain '\\.\\.' path components"
         ):
-            self.loader._validate_config_dir("/some/path/../../../etc", "TEST_VAR")
+            loader._validate_config_dir("/some/path/../../../etc", "TEST_VAR")
@@ -12,22 +12,39 @@ from ccguardian.config import (
     RawConfiguration,
     SourceType,
 )
+from ccguardian.config.merger import _compile_default_rule_patterns
 from ccguardian.rules import DEFAULT_PRIORITY, PathAccessRule, PreUseBashRule
 
 
-class TestConfigurationMerger:
-    def setup_method(self):
-        self.merger = ConfigurationMerger()
+@pytest.fixture(scope="module")
+def merger():
+    return ConfigurationMerger()
+
+
+@pytest.fixture(scope="module")
+def default_source():
+    return ConfigurationSource(SourceType.DEFAULT, Path("/default.yml"), True)
+
+
+@pytest.fixture(scope="module")
+def user_source():
+    return ConfigurationSource(SourceType.USER, Path("/user.yml"), True)
 
-    def test_merge_empty_configurations(self):
-        result = self.merger.merge_configurations([])
+
+@pytest.fixture(scope="module")
+def local_source():
+    return ConfigurationSource(SourceType.LOCAL, Path("/local.yml"), True)
+
+
+class TestConfigurationMerger:
+    def test_merge_empty_configurations(self, merger):
+        result = merger.merge_configurations([])
 
         assert result.sources == []
         assert result.default_rules is True
         assert result.rules == []
 
-    def test_merge_single_configuration(self):
-        source = ConfigurationSource(SourceType.USER, Path("/user.yml"), True)
+    def test_merge_single_configuration(self, merger, user_source):
         config_data = ConfigFile.model_validate(
             {
                 "default_rules": False,
@@ -41,12 +58,12 @@ class TestConfigurationMerger:
                 },
             }
         )
-        raw_config = RawConfiguration(source=source, data=config_data)
+        raw_config = RawConfiguration(source=user_source, data=config_data)
 
-        result = self.merger.merge_configurations([raw_config])
+        result = merger.merge_configurations([raw_config])
 
         assert len(result.sources) == 1
-        assert result.sources[0] == source
+        assert result.sources[0] == user_source
         assert result.default_rules is False
 
         assert len(result.rules) == 1
@@ -56,10 +73,27 @@ class TestConfigurationMerger:
         assert rule.action.value == "deny"
         assert rule.enabled is True
 
-    def test_merge_multiple_configurations_hierarchy(self):
+    def test_merge_duplicate_source_path(self, merger):
+        config_data = ConfigFile.model_validate(
+            {"rules": {"test.rule": {"type": "pre_use_bash", "pattern": "test"}}}
+        )
+        user_config = RawConfiguration(
+            source=ConfigurationSource(SourceType.USER, Path("/shared.yml"), True),
+            data=config_data,
+        )
+        shared_config = RawConfiguration(
+            source=ConfigurationSource(SourceType.SHARED, Path("/shared.yml"), True),
+            data=config_data,
+        )
+
+        result = merger.merge_configurations([user_config, shared_config])
+
+        assert result.sources == [user_config.source]
+        assert [rule.id for rule in result.rules] == ["test.rule"]
+
+    def test_merge_multiple_configurations_hierarchy(self, merger, user_source, default_source):
         """Test configuration merging with hierarchy, rule creation, and priority sorting."""
         # Default config with low-priority rules
-        default_source = ConfigurationSource(SourceType.DEFAULT, Path("/default.yml"), True)
         default_config_data = ConfigFile.model_validate(
             {
                 "default_rules": True,
@@ -88,7 +122,6 @@ class TestConfigurationMerger:
         default_config = RawConfiguration(source=default_source, data=default_config_data)
 
         # User config with mixed priorities and partial overrides
-        user_source = ConfigurationSource(SourceType.USER, Path("/user.yml"), True)
         user_config_data = ConfigFile.model_validate(
             {
                 "default_rules": ["security.*"],  # Only include security rules from defaults
@@ -135,7 +168,7 @@ class TestConfigurationMerger:
         )
         local_config = RawConfiguration(source=local_source, data=local_config_data)
 
-        result = self.merger.merge_configurations([default_config, user_config, local_config])
+        result = merger.merge_configurations([default_config, user_config, local_config])
 
         assert len(result.sources) == 3
         assert result.default_rules == ["security.*"]  # From user config
@@ -173,26 +206,51 @@ class TestConfigurationMerger:
         assert result.rules[6].enabled is False  # Disabled by pattern filtering
         assert isinstance(result.rules[6], PreUseBashRule)
 
-    def test_should_enable_default_rule_disabled(self):
-        assert not self.merger._should_enable_default_rule("security.test", False)
-
-    def test_should_enable_default_rule_all_enabled(self):
-        assert self.merger._should_enable_default_rule("security.test", True)
-        assert self.merger._should_enable_default_rule("performance.test", True)
-
-    def test_should_enable_default_rule_pattern_matching(self):
-        patterns = ["security.*", "performance.grep*"]
-
-        # Should match
-        assert self.merger._should_enable_default_rule("security.dangerous", patterns)
-        assert self.merger._should_enable_default_rule("performance.grep_suggestion", patterns)
-
-        # Should not match
-        assert not self.merger._should_enable_default_rule("debug.logging", patterns)
-        assert not self.merger._should_enable_default_rule("performance.find", patterns)
+    def test_should_enable_default_rule_disabled(self, merger):
+        assert not merger._should_enable_default_rule("security.test", False)
+
+    def test_should_enable_default_rule_all_enabled(self, merger):
+        assert merger._should_enable_default_rule("security.test", True)
+        assert merger._should_enable_default_rule("performance.test", True)
+
+    @pytest.mark.parametrize(
+        ("rule_id", "expected"),
+        [
+            ("security.dangerous", True),
+            ("performance.grep_suggestion", True),
+            ("debug.logging", False),
+            ("performance.find", False),
+        ],
+    )
+    def test_should_enable_default_rule_pattern_matching(self, merger, rule_id, expected):
+        patterns = _compile_default_rule_patterns(("security.*", "performance.grep*"))
+
+        assert merger._should_enable_default_rule(rule_id, patterns) is expected
+
+    @pytest.mark.parametrize(
+        ("rule_id", "expected"),
+        [
+            ("debug.logging", True),
+            ("performance.find", True),
+            ("security.env", True),
+            ("debug.logging_extra", False),
+            ("performance.ls", False),
+            ("security.env_files", False),
+        ],
+    )
+    def test_should_enable_default_rule_exact_and_glob_patterns(self, merger, rule_id, expected):
+        patterns = _compile_default_rule_patterns(("debug.logging", "perf?rmance.[fg]*", "*.env"))
+
+        assert merger._should_enable_default_rule(rule_id, patterns) is expected
+
+    def test_compile_default_rule_patterns_is_cached(self):
+        patterns = ("security.*", "performance.grep*")
+
+        assert _compile_default_rule_patterns(patterns) is _compile_default_rule_patterns(
+            patterns
+        )
 
-    def test_merge_rules_by_id_simple(self):
-        source = ConfigurationSource(SourceType.USER, Path("/user.yml"), True)
+    def test_merge_rules_by_id_simple(self, merger, user_source):
         config_data = ConfigFile.model_validate(
             {
                 "rules": {
@@ -201,9 +259,9 @@ class TestConfigurationMerger:
                 }
             }
         )
-        raw_config = RawConfiguration(source=source, data=config_data)
+        raw_config = RawConfiguration(source=user_source, data=config_data)
 
-        result = self.merger._merge_rules_by_id([raw_config], True)
+        result = merger._merge_rules_by_id([raw_config], True)
 
         assert len(result) == 2
         assert "test.rule1" in result
@@ -221,9 +279,8 @@ class TestConfigurationMerger:
         assert len(rule2.paths) == 1
         assert rule2.paths[0].pattern == "*.env"
 
-    def test_merge_rules_by_id_override(self):
+    def test_merge_rules_by_id_override(self, merger, user_source, local_source):
         # First config
-        source1 = ConfigurationSource(SourceType.USER, Path("/user.yml"), True)
         config_data1 = ConfigFile.model_validate(
             {
                 "rules": {
@@ -236,10 +293,9 @@ class TestConfigurationMerger:
                 }
             }
         )
-        config1 = RawConfiguration(source=source1, data=config_data1)
+        config1 = RawConfiguration(source=user_source, data=config_data1)
 
         # Second config provides partial overrides (no type field = partial merge)
-        source2 = ConfigurationSource(SourceType.LOCAL, Path("/local.yml"), True)
         config_data2 = ConfigFile.model_validate(
             {
                 "rules": {
@@ -252,9 +308,9 @@ class TestConfigurationMerger:
                 }
             }
         )
-        config2 = RawConfiguration(source=source2, data=config_data2)
+        config2 = RawConfiguration(source=local_source, data=config_data2)
 
-        result = self.merger._merge_rules_by_id([config1, config2], True)
+        result = merger._merge_rules_by_id([config1, config2], True)
 
         assert len(result) == 1
         assert "test.rule" in result
@@ -266,16 +322,14 @@ class TestConfigurationMerger:
         assert rule.priority == 10  # From first config (preserved during merge)
         assert rule.message == "Blocked by local config"  # Added
 
-    def test_merge_rules_type_protection(self):
+    def test_merge_rules_type_protection(self, merger, user_source, local_source):
         # First config sets type
-        source1 = ConfigurationSource(SourceType.USER, Path("/user.yml"), True)
         config_data1 = ConfigFile.model_validate(
             {"rules": {"test.rule": {"type": "pre_use_bash", "pattern": "test"}}}
         )
-        config1 = RawConfiguration(source=source1, data=config_data1)
+        config1 = RawConfiguration(source=user_source, data=config_data1)
 
         # Second config with different type for same rule ID
-        source2 = ConfigurationSource(SourceType.LOCAL, Path("/local.yml"), True)
         config_data2 = ConfigFile.model_validate(
             {
                 "rules": {
@@ -287,19 +341,18 @@ class TestConfigurationMerger:
                 }
             }
         )
-        config2 = RawConfiguration(source=source2, data=config_data2)
+        config2 = RawConfiguration(source=local_source, data=config_data2)
 
         with pytest.raises(ConfigValidationError) as exc_info:
-            self.merger._merge_rules_by_id([config1, config2], True)
+            merger._merge_rules_by_id([config1, config2], True)
 
         assert "Cannot change rule type from 'pre_use_bash' to 'path_access'" in str(
             exc_info.value
         )
         assert "test.rule" in str(exc_info.value)
 
-    def test_merge_rules_default_filtering(self):
+    def test_merge_rules_default_filtering(self, merger, default_source):
         # Default config with multiple rules
-        default_source = ConfigurationSource(SourceType.DEFAULT, Path("/default.yml"), True)
         config_data = ConfigFile.model_validate(
             {
                 "rules": {
@@ -312,7 +365,7 @@ class TestConfigurationMerger:
         default_config = RawConfiguration(source=default_source, data=config_data)
 
         # Test with patterns filtering - all rules should be included but with different enabled states
-        result = self.merger._merge_rules_by_id([default_config], ["security.*", "performance.*"])
+        result = merger._merge_rules_by_id([default_config], ["security.*", "performance.*"])
 
         assert len(result) == 3  # All rules are included
         assert "security.dangerous" in result
@@ -324,3 +377,26 @@ class TestConfigurationMerger:
         assert result["performance.grep"].enabled is True
         # Rules not matching patterns should be disabled
         assert result["debug.logging"].enabled is False
+
+    def test_merge_rules_default_filtering_empty_patterns(self, merger, default_source):
+        config_data = ConfigFile.model_validate(
+            {"rules": {"security.dangerous": {"type": "pre_use_bash", "pattern": "rm -rf"}}}
+        )
+        default_config = RawConfiguration(source=default_source, data=config_data)
+
+        result = merger._merge_rules_by_id([default_config], [])
+
+        assert result["security.dangerous"].enabled is False
+
+    def test_merge_rules_default_filtering_does_not_modify_input(self, merger, default_source):
+        config_data = ConfigFile.model_validate(
+            {"rules": {"security.dangerous": {"type": "pre_use_bash", "pattern": "rm -rf"}}}
+        )
+        default_config = RawConfiguration(source=default_source, data=config_data)
+
+        disabled = merger._merge_rules_by_id([default_config], False)
+        enabled = merger._merge_rules_by_id([default_config], True)
+
+        assert disabled["security.dangerous"].enabled is False
+        assert enabled["security.dangerous"].enabled is True
+        assert config_data.rules["security.dangerous"].enabled is None
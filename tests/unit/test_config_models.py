@@ -19,6 +19,19 @@ from ccguardian.rules import (
 )
 
 
+def assert_single_error(exc_info, message, loc=None):
+    errors = exc_info.value.errors()
+    assert len(errors) == 1
+    assert message.lower() in errors[0]["msg"].lower()
+    if loc is not None:
+        assert errors[0]["loc"] == loc
+
+
+@pytest.fixture(scope="module")
+def base_bash_rule():
+    return PreUseBashRuleConfig(type="pre_use_bash", pattern="test")
+
+
 class TestCommandPatternModel:
     """Tests for CommandPatternModel."""
 
@@ -47,19 +60,14 @@ class TestCommandPatternModel:
         with pytest.raises(ValidationError) as exc_info:
             CommandPatternModel(pattern="[unclosed")
 
-        errors = exc_info.value.errors()
-        assert len(errors) == 1
-        assert "Invalid regex pattern" in errors[0]["msg"]
-        assert errors[0]["loc"] == ("pattern",)
+        assert_single_error(exc_info, "Invalid regex pattern", ("pattern",))
 
     def test_empty_pattern(self):
         """Test validation of empty pattern."""
         with pytest.raises(ValidationError) as exc_info:
             CommandPatternModel(pattern="")
 
-        errors = exc_info.value.errors()
-        assert len(errors) == 1
-        assert "Pattern must be a non-empty string" in errors[0]["msg"]
+        assert_single_error(exc_info, "Pattern must be a non-empty string")
 
     def test_none_pattern(self):
         """Test validation of None pattern."""
@@ -93,9 +101,9 @@ class TestPathPatternModel:
         assert pattern.action is None
         assert pattern.message is None
 
-    def test_glob_pattern_validation_simple(self):
-        """Test various valid glob patterns."""
-        valid_patterns = [
+    @pytest.mark.parametrize(
+        "pattern_str",
+        [
             "*.txt",
             "**/*.py",
             "/etc/**",
@@ -103,36 +111,27 @@ class TestPathPatternModel:
             "**/secrets/**",
             "file[12].txt",
             "file?.txt",
-        ]
-
-        for pattern_str in valid_patterns:
-            pattern = PathPatternModel(pattern=pattern_str)
-            assert pattern.pattern == pattern_str
+        ],
+    )
+    def test_glob_pattern_validation_simple(self, pattern_str):
+        """Test various valid glob patterns."""
+        pattern = PathPatternModel(pattern=pattern_str)
+        assert pattern.pattern == pattern_str
 
-    def test_invalid_glob_pattern_unbalanced_brackets(self):
+    @pytest.mark.parametrize("pattern_str", ["[unclosed", "unclosed]", "nested[[brackets]]"])
+    def test_invalid_glob_pattern_unbalanced_brackets(self, pattern_str):
         """Test validation of glob patterns with unbalanced brackets."""
-        invalid_patterns = [
-            "[unclosed",
-            "unclosed]",
-            "nested[[brackets]]",
-        ]
-
-        for pattern_str in invalid_patterns:
-            with pytest.raises(ValidationError) as exc_info:
-                PathPatternModel(pattern=pattern_str)
+        with pytest.raises(ValidationError) as exc_info:
+            PathPatternModel(pattern=pattern_str)
 
-            errors = exc_info.value.errors()
-            assert len(errors) == 1
-            assert "bracket" in errors[0]["msg"].lower()
+        assert_single_error(exc_info, "bracket")
 
     def test_empty_pattern(self):
         """Test validation of empty pattern."""
         with pytest.raises(ValidationError) as exc_info:
             PathPatternModel(pattern="")
 
-        errors = exc_info.value.errors()
-        assert len(errors) == 1
-        assert "Pattern must be a non-empty string" in errors[0]["msg"]
+        assert_single_error(exc_info, "Pattern must be a non-empty string")
 
 
 class TestPreUseBashRuleConfig:
@@ -189,9 +188,7 @@ class TestPreUseBashRuleConfig:
         with pytest.raises(ValidationError) as exc_info:
             PreUseBashRuleConfig(type="pre_use_bash")
 
-        errors = exc_info.value.errors()
-        assert len(errors) == 1
-        assert "requires either 'pattern' or 'commands'" in errors[0]["msg"]
+        assert_single_error(exc_info, "requires either 'pattern' or 'commands'")
 
     def test_both_pattern_and_commands(self):
         """Test validation when both pattern and commands are provided."""
@@ -202,9 +199,7 @@ class TestPreUseBashRuleConfig:
                 commands=[CommandPatternModel(pattern="ls")],
             )
 
-        errors = exc_info.value.errors()
-        assert len(errors) == 1
-        assert "mutually exclusive" in errors[0]["msg"]
+        assert_single_error(exc_info, "mutually exclusive")
 
     def test_empty_commands_list(self):
         """Test validation of empty commands list."""
@@ -214,9 +209,7 @@ class TestPreUseBashRuleConfig:
                 commands=[],
             )
 
-        errors = exc_info.value.errors()
-        assert len(errors) == 1
-        assert "cannot be empty" in errors[0]["msg"]
+        assert_single_error(exc_info, "cannot be empty")
 
     def test_invalid_regex_in_pattern(self):
         """Test validation of invalid regex in pattern field."""
@@ -226,9 +219,7 @@ class TestPreUseBashRuleConfig:
                 pattern="[invalid",
             )
 
-        errors = exc_info.value.errors()
-        assert len(errors) == 1
-        assert "Invalid regex pattern" in errors[0]["msg"]
+        assert_single_error(exc_info, "Invalid regex pattern")
 
     def test_negative_priority(self):
         """Test validation of negative priority."""
@@ -239,9 +230,7 @@ class TestPreUseBashRuleConfig:
                 priority=-1,
             )
 
-        errors = exc_info.value.errors()
-        assert len(errors) == 1
-        assert "Priority must be non-negative" in errors[0]["msg"]
+        assert_single_error(exc_info, "Priority must be non-negative")
 
     def test_wrong_type(self):
         """Test validation of wrong rule type."""
@@ -267,6 +256,14 @@ class TestPreUseBashRuleConfig:
         assert rule.action is None
         assert rule.message is None
 
+    def test_frozen(self):
+        rule = PreUseBashRuleConfig(type="pre_use_bash", pattern="ls")
+
+        with pytest.raises(ValidationError):
+            rule.enabled = True
+
+        assert rule.enabled is None
+
     def test_pre_use_bash_rule_merge_pattern(self):
         """Test merging a pattern into an existing PreUseBashRule."""
         base_rule = PreUseBashRuleConfig(
@@ -309,32 +306,26 @@ class TestPreUseBashRuleConfig:
         assert result.commands[1].action == Action.ASK
         assert result.pattern is None  # Pattern cleared after commands override
 
-    def test_merge_invalid_action(self):
+    def test_merge_invalid_action(self, base_bash_rule):
         """Test that merge validates action values."""
-        base_rule = PreUseBashRuleConfig(type="pre_use_bash", pattern="test")
-
         partial_config = {"action": "invalid_action"}
 
         with pytest.raises(ValueError, match="Invalid action value"):
-            base_rule.merge(partial_config)
+            base_bash_rule.merge(partial_config)
 
-    def test_merge_invalid_priority(self):
+    def test_merge_invalid_priority(self, base_bash_rule):
         """Test that merge validates priority values."""
-        base_rule = PreUseBashRuleConfig(type="pre_use_bash", pattern="test")
-
         partial_config = {"priority": -1}
 
         with pytest.raises(ValueError, match="Priority must be a non-negative integer"):
-            base_rule.merge(partial_config)
+            base_bash_rule.merge(partial_config)
 
-    def test_merge_invalid_commands_list(self):
+    def test_merge_invalid_commands_list(self, base_bash_rule):
         """Test that merge validates commands list structure."""
-        base_rule = PreUseBashRuleConfig(type="pre_use_bash", pattern="test")
-
         partial_config = {"commands": "not_a_list"}
 
         with pytest.raises(ValueError, match="'commands' field must be a non-empty list"):
-            base_rule.merge(partial_config)
+            base_bash_rule.merge(partial_config)
 
     def test_to_rule_conversion(self):
         """Test converting PreUseBashRuleConfig to PreUseBashRule."""
@@ -457,9 +448,7 @@ class TestPathAccessRuleConfig:
         with pytest.raises(ValidationError) as exc_info:
             PathAccessRuleConfig(type="path_access")
 
-        errors = exc_info.value.errors()
-        assert len(errors) == 1
-        assert "requires either 'pattern' or 'paths'" in errors[0]["msg"]
+        assert_single_error(exc_info, "requires either 'pattern' or 'paths'")
 
     def test_both_pattern_and_paths(self):
         """Test validation when both pattern and paths are provided."""
@@ -470,9 +459,7 @@ class TestPathAccessRuleConfig:
                 paths=[PathPatternModel(pattern="*.txt")],
             )
 
-        errors = exc_info.value.errors()
-        assert len(errors) == 1
-        assert "mutually exclusive" in errors[0]["msg"]
+        assert_single_error(exc_info, "mutually exclusive")
 
     def test_empty_paths_list(self):
         """Test validation of empty paths list."""
@@ -482,9 +469,7 @@ class TestPathAccessRuleConfig:
                 paths=[],
             )
 
-        errors = exc_info.value.errors()
-        assert len(errors) == 1
-        assert "cannot be empty" in errors[0]["msg"]
+        assert_single_error(exc_info, "cannot be empty")
 
     def test_invalid_glob_in_pattern(self):
         """Test validation of invalid glob in pattern field."""
@@ -494,9 +479,7 @@ class TestPathAccessRuleConfig:
                 pattern="[invalid",
             )
 
-        errors = exc_info.value.errors()
-        assert len(errors) == 1
-        assert "bracket" in errors[0]["msg"].lower()
+        assert_single_error(exc_info, "bracket")
 
     def test_wrong_type(self):
         """Test validation of wrong rule type."""
@@ -681,7 +664,7 @@ class TestConfigFile:
         errors = exc_info.value.errors()
         # Pydantic union types produce multiple errors for different attempted types
         assert len(errors) >= 1
-        error_messages = " ".join([error["msg"] for error in errors])
+        error_messages = " ".join(error["msg"] for error in errors)
         assert "boolean" in error_messages or "list" in error_messages
 
     def test_invalid_default_rules_list_item(self):
@@ -692,7 +675,7 @@ class TestConfigFile:
         errors = exc_info.value.errors()
         # Pydantic union types produce multiple errors for different attempted types
         assert len(errors) >= 1
-        error_messages = " ".join([error["msg"] for error in errors])
+        error_messages = " ".join(error["msg"] for error in errors)
         assert "string" in error_messages or "boolean" in error_messages
 
     def test_invalid_rule_id_empty(self):
@@ -700,18 +683,14 @@ class TestConfigFile:
         with pytest.raises(ValidationError) as exc_info:
             ConfigFile(rules={"": PreUseBashRuleConfig(type="pre_use_bash", pattern="ls")})
 
-        errors = exc_info.value.errors()
-        assert len(errors) == 1
-        assert "non-empty string" in errors[0]["msg"]
+        assert_single_error(exc_info, "non-empty string")
 
     def test_invalid_rule_id_whitespace(self):
         """Test validation of whitespace-only rule ID."""
         with pytest.raises(ValidationError) as exc_info:
             ConfigFile(rules={"   ": PreUseBashRuleConfig(type="pre_use_bash", pattern="ls")})
 
-        errors = exc_info.value.errors()
-        assert len(errors) == 1
-        assert "non-empty string" in errors[0]["msg"]
+        assert_single_error(exc_info, "non-empty string")
 
     def test_discriminated_union_validation(self):
         """Test that discriminated union works correctly."""
@@ -1,6 +1,6 @@
 """Tests for Engine class."""
 
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pytest
 
@@ -10,6 +10,27 @@ from ccguardian.rules import Action, CommandPattern, PreUseBashRule, RuleResult
 from tests.utils import post_use_write_context, pre_use_bash_context, session_start_context
 
 
+@pytest.fixture
+def patched_config_manager_cls(monkeypatch):
+    mock = Mock()
+    monkeypatch.setattr("ccguardian.engine.ConfigurationManager", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_exit_success(monkeypatch):
+    mock = Mock(side_effect=SystemExit(0))
+    monkeypatch.setattr("ccguardian.engine.exit_success", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_exit_non_block(monkeypatch):
+    mock = Mock(side_effect=SystemExit(0))
+    monkeypatch.setattr("ccguardian.engine.exit_non_block", mock)
+    return mock
+
+
 class TestEngineInit:
     def test_init_stores_context(self):
         context = pre_use_bash_context("ls -la")
@@ -19,46 +40,40 @@ class TestEngineInit:
 
 
 class TestEngineRun:
-    @patch("ccguardian.engine.exit_success")
-    @patch("ccguardian.engine.ConfigurationManager")
-    def test_run_session_start_context(self, mock_config_manager, mock_exit_success):
+    def test_run_session_start_context(self, patched_config_manager_cls, mock_exit_success):
         context = session_start_context()
 
         mock_config = Mock()
-        mock_config_manager.return_value.load_configuration.return_value = mock_config
-        mock_exit_success.side_effect = SystemExit(0)
+        patched_config_manager_cls.return_value.load_configuration.return_value = mock_config
 
         engine = Engine(context)
 
         with pytest.raises(SystemExit):
             engine.run()
 
-        mock_config_manager.assert_called_once()
-        mock_config_manager.return_value.load_configuration.assert_called_once()
+        patched_config_manager_cls.assert_called_once()
+        patched_config_manager_cls.return_value.load_configuration.assert_called_once()
         mock_exit_success.assert_called_once()
 
-    @patch("ccguardian.engine.ConfigurationManager")
-    def test_run_pre_tool_use_context(self, mock_config_manager):
+    def test_run_pre_tool_use_context(self, mocker, patched_config_manager_cls):
         context = pre_use_bash_context("ls -la")
 
         mock_config = Mock()
         mock_config.active_rules = []
-        mock_config_manager.return_value.load_configuration.return_value = mock_config
+        patched_config_manager_cls.return_value.load_configuration.return_value = mock_config
 
         engine = Engine(context)
-        with patch.object(engine, "evaluate_rules", return_value=None) as mock_evaluate:
-            with patch.object(engine, "handle_result") as mock_handle:
-                engine.run()
+        mock_evaluate = mocker.patch.object(engine, "evaluate_rules", return_value=None)
+        mock_handle = mocker.patch.object(engine, "handle_result")
 
-                mock_evaluate.assert_called_once_with([])
-                mock_handle.assert_called_once_with(None)
+        engine.run()
+
+        mock_evaluate.assert_called_once_with([])
+        mock_handle.assert_called_once_with(None)
 
-    @patch("ccguardian.engine.exit_success")
     def test_run_other_context_types(self, mock_exit_success):
         context = post_use_write_context("/tmp/test.txt")
 
-        mock_exit_success.side_effect = SystemExit(0)
-
         engine = Engine(context)
 
         with pytest.raises(SystemExit):
@@ -66,14 +81,11 @@ class TestEngineRun:
 
         mock_exit_success.assert_called_once()
 
-    @patch("ccguardian.engine.exit_non_block")
-    @patch("ccguardian.engine.ConfigurationManager")
-    def test_run_config_validation_error(self, mock_config_manager, mock_exit_non_block):
+    def test_run_config_validation_error(self, patched_config_manager_cls, mock_exit_non_block):
         context = pre_use_bash_context("ls -la")
-        mock_config_manager.return_value.load_configuration.side_effect = ConfigValidationError(
-            "Test error"
+        patched_config_manager_cls.return_value.load_configuration.side_effect = (
+            ConfigValidationError("Test error")
         )
-        mock_exit_non_block.side_effect = SystemExit(0)
 
         engine = Engine(context)
 
@@ -84,14 +96,11 @@ class TestEngineRun:
             "Claude Code Guardian configuration error: Test error"
         )
 
-    @patch("ccguardian.engine.exit_non_block")
-    @patch("ccguardian.engine.ConfigurationManager")
-    def test_run_general_exception(self, mock_config_manager, mock_exit_non_block):
+    def test_run_general_exception(self, patched_config_manager_cls, mock_exit_non_block):
         context = pre_use_bash_context("ls -la")
-        mock_config_manager.return_value.load_configuration.side_effect = Exception(
+        patched_config_manager_cls.return_value.load_configuration.side_effect = Exception(
             "General error"
         )
-        mock_exit_non_block.side_effect = SystemExit(0)
 
         engine = Engine(context)
 
@@ -122,7 +131,8 @@ class TestEngineEvaluateRules:
         result = engine.evaluate_rules([rule])
 
         assert result is None
-        rule.evaluate.assert_called_once_with(context)
+        rule.evaluate.assert_called_once()
+        assert rule.evaluate.call_args.args[0] is context
 
     def test_evaluate_rules_first_match_wins(self):
         context = pre_use_bash_context("grep test")
@@ -141,7 +151,8 @@ class TestEngineEvaluateRules:
         result = engine.evaluate_rules([rule1, rule2])
 
         assert result is rule1_result
-        rule1.evaluate.assert_called_once_with(context)
+        rule1.evaluate.assert_called_once()
+        assert rule1.evaluate.call_args.args[0] is context
         rule2.evaluate.assert_not_called()
 
     def test_evaluate_rules_with_real_rule(self):
@@ -174,21 +185,15 @@ class TestEngineHandleResult:
         self.context = pre_use_bash_context("ls -la")
         self.engine = Engine(self.context)
 
-    @patch("ccguardian.engine.exit_success")
     def test_handle_result_none(self, mock_exit_success):
-        mock_exit_success.side_effect = SystemExit(0)
-
         with pytest.raises(SystemExit):
             self.engine.handle_result(None)
 
         mock_exit_success.assert_called_once()
 
-    @patch("ccguardian.engine.exit_success")
     def test_handle_result_allow(self, mock_exit_success):
         result = RuleResult(rule_id="test.rule", action=Action.ALLOW, message="Test message")
 
-        mock_exit_success.side_effect = SystemExit(0)
-
         with pytest.raises(SystemExit):
             self.engine.handle_result(result)
 
@@ -197,12 +202,9 @@ class TestEngineHandleResult:
         assert "Guardian: Action allowed. Test message" in call_args
         mock_exit_success.assert_called_once()
 
-    @patch("ccguardian.engine.exit_success")
     def test_handle_result_warn(self, mock_exit_success):
         result = RuleResult(rule_id="test.rule", action=Action.WARN, message="Test warning")
 
-        mock_exit_success.side_effect = SystemExit(0)
-
         with pytest.raises(SystemExit):
             self.engine.handle_result(result)
 
@@ -211,12 +213,9 @@ class TestEngineHandleResult:
         assert "Guardian: Test warning" in call_args["system_message"]
         mock_exit_success.assert_called_once()
 
-    @patch("ccguardian.engine.exit_success")
     def test_handle_result_ask(self, mock_exit_success):
         result = RuleResult(rule_id="test.rule", action=Action.ASK, message="Ask user")
 
-        mock_exit_success.side_effect = SystemExit(0)
-
         with pytest.raises(SystemExit):
             self.engine.handle_result(result)
 
@@ -225,12 +224,9 @@ class TestEngineHandleResult:
         assert "Guardian: Ask user" in call_args
         mock_exit_success.assert_called_once()
 
-    @patch("ccguardian.engine.exit_success")
     def test_handle_result_deny(self, mock_exit_success):
         result = RuleResult(rule_id="test.rule", action=Action.DENY, message="Denied")
 
-        mock_exit_success.side_effect = SystemExit(0)
-
         with pytest.raises(SystemExit):
             self.engine.handle_result(result)
 
@@ -239,12 +235,9 @@ class TestEngineHandleResult:
         assert "Guardian: Denied" in call_args
         mock_exit_success.assert_called_once()
 
-    @patch("ccguardian.engine.exit_success")
     def test_handle_result_halt(self, mock_exit_success):
         result = RuleResult(rule_id="test.rule", action=Action.HALT, message="Halt execution")
 
-        mock_exit_success.side_effect = SystemExit(0)
-
         with pytest.raises(SystemExit):
             self.engine.handle_result(result)
 
@@ -253,12 +246,9 @@ class TestEngineHandleResult:
         assert "Guardian: 🛑 Halting. Halt execution" in call_args
         mock_exit_success.assert_called_once()
 
-    @patch("ccguardian.engine.exit_success")
     def test_handle_result_continue(self, mock_exit_success):
         result = RuleResult(rule_id="test.rule", action=Action.CONTINUE, message="Continue")
 
-        mock_exit_success.side_effect = SystemExit(0)
-
         with pytest.raises(SystemExit):
             self.engine.handle_result(result)
 
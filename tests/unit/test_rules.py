@@ -1,5 +1,6 @@
 """Tests for rule evaluation functionality."""
 
+import re
 from unittest.mock import Mock
 
 import pytest
@@ -21,6 +22,16 @@ from tests.utils import (
 )
 
 
+@pytest.fixture(scope="module")
+def grep_rule():
+    return PreUseBashRule(id="test-rule", commands=[CommandPattern(pattern="grep")])
+
+
+@pytest.fixture(scope="module")
+def env_rule():
+    return PathAccessRule(id="test-rule", paths=[PathPattern(pattern="*.env")])
+
+
 class TestPreUseBashRule:
     def test_evaluate_rule_disabled_returns_none(self):
         rule = PreUseBashRule(
@@ -33,44 +44,28 @@ class TestPreUseBashRule:
         result = rule.evaluate(context)
         assert result is None
 
-    def test_evaluate_non_pretooluse_context_returns_none(self):
-        rule = PreUseBashRule(
-            id="test-rule",
-            commands=[CommandPattern(pattern="grep")],
-        )
+    def test_evaluate_non_pretooluse_context_returns_none(self, grep_rule):
         context = Mock(spec=PostToolUseContext)
 
-        result = rule.evaluate(context)
+        result = grep_rule.evaluate(context)
         assert result is None
 
-    def test_evaluate_non_bash_tool_returns_none(self):
-        rule = PreUseBashRule(
-            id="test-rule",
-            commands=[CommandPattern(pattern="grep")],
-        )
+    def test_evaluate_non_bash_tool_returns_none(self, grep_rule):
         context = pre_use_read_context("/some/file.txt")
 
-        result = rule.evaluate(context)
+        result = grep_rule.evaluate(context)
         assert result is None
 
-    def test_evaluate_missing_command_returns_none(self):
-        rule = PreUseBashRule(
-            id="test-rule",
-            commands=[CommandPattern(pattern="grep")],
-        )
+    def test_evaluate_missing_command_returns_none(self, grep_rule):
         context = pre_use_context("Bash", other="value")
 
-        result = rule.evaluate(context)
+        result = grep_rule.evaluate(context)
         assert result is None
 
-    def test_evaluate_empty_command_returns_none(self):
-        rule = PreUseBashRule(
-            id="test-rule",
-            commands=[CommandPattern(pattern="grep")],
-        )
+    def test_evaluate_empty_command_returns_none(self, grep_rule):
         context = pre_use_bash_context("")
 
-        result = rule.evaluate(context)
+        result = grep_rule.evaluate(context)
 
         assert result is None
 
@@ -189,6 +184,12 @@ class TestPreUseBashRule:
         assert result is not None
         assert result.matched_pattern == r"rm\s+-rf"
 
+    def test_command_pattern_compiles_regex(self):
+        pattern = CommandPattern(pattern=r"^git\s+push")
+
+        assert isinstance(pattern.regex, re.Pattern)
+        assert pattern.regex.pattern == r"^git\s+push"
+
 
 class TestPathAccessRule:
     def test_evaluate_rule_disabled_returns_none(self):
@@ -202,44 +203,28 @@ class TestPathAccessRule:
         result = rule.evaluate(context)
         assert result is None
 
-    def test_evaluate_non_pretooluse_context_returns_none(self):
-        rule = PathAccessRule(
-            id="test-rule",
-            paths=[PathPattern(pattern="*.env")],
-        )
+    def test_evaluate_non_pretooluse_context_returns_none(self, env_rule):
         context = Mock(spec=PostToolUseContext)
 
-        result = rule.evaluate(context)
+        result = env_rule.evaluate(context)
         assert result is None
 
-    def test_evaluate_non_file_access_tool_returns_none(self):
-        rule = PathAccessRule(
-            id="test-rule",
-            paths=[PathPattern(pattern="*.env")],
-        )
+    def test_evaluate_non_file_access_tool_returns_none(self, env_rule):
         context = pre_use_context("Bash")
 
-        result = rule.evaluate(context)
+        result = env_rule.evaluate(context)
         assert result is None
 
-    def test_evaluate_missing_file_path_returns_none(self):
-        rule = PathAccessRule(
-            id="test-rule",
-            paths=[PathPattern(pattern="*.env")],
-        )
+    def test_evaluate_missing_file_path_returns_none(self, env_rule):
         context = pre_use_context("Read", other="value")
 
-        result = rule.evaluate(context)
+        result = env_rule.evaluate(context)
         assert result is None
 
-    def test_evaluate_empty_file_path_returns_none(self):
-        rule = PathAccessRule(
-            id="test-rule",
-            paths=[PathPattern(pattern="*.env")],
-        )
+    def test_evaluate_empty_file_path_returns_none(self, env_rule):
         context = pre_use_read_context("")
 
-        result = rule.evaluate(context)
+        result = env_rule.evaluate(context)
         assert result is None
 
     def test_evaluate_read_tool_matches_pattern(self):
@@ -259,18 +244,14 @@ class TestPathAccessRule:
         assert result.message == "Environment files blocked"
         assert result.matched_pattern == "*.env"
 
-    def test_evaluate_write_tools_match_pattern(self):
-        for tool_name in ["Edit", "MultiEdit", "Write"]:
-            rule = PathAccessRule(
-                id="test-rule",
-                paths=[PathPattern(pattern="*.env")],
-            )
-            context = pre_use_write_context("/home/user/.env", tool_name)
+    @pytest.mark.parametrize("tool_name", ["Edit", "MultiEdit", "Write"])
+    def test_evaluate_write_tools_match_pattern(self, env_rule, tool_name):
+        context = pre_use_write_context("/home/user/.env", tool_name)
 
-            result = rule.evaluate(context)
+        result = env_rule.evaluate(context)
 
-            assert result is not None
-            assert result.matched_pattern == "*.env"
+        assert result is not None
+        assert result.matched_pattern == "*.env"
 
     @pytest.mark.parametrize(
         ("scope", "pattern", "file_path", "should_match_read", "should_match_write"),
@@ -321,18 +302,10 @@ class TestPathAccessRule:
         assert result.action == Action.DENY
         assert result.message == "Custom env message"
 
-    def test_evaluate_fallback_message_generation(self):
-        rule = PathAccessRule(
-            id="test-rule",
-            # No rule message
-            paths=[
-                PathPattern(pattern="*.env")
-                # No pattern message
-            ],
-        )
+    def test_evaluate_fallback_message_generation(self, env_rule):
         context = pre_use_read_context("/home/user/.env")
 
-        result = rule.evaluate(context)
+        result = env_rule.evaluate(context)
 
         assert result is not None
         assert result.message == "Path matched pattern: *.env"
@@ -365,6 +338,12 @@ class TestPathAccessRule:
         else:
             assert result is None, f"Pattern '{pattern}' should not match '{file_path}'"
 
+    def test_path_pattern_compiles_glob(self):
+        pattern = PathPattern(pattern="**/.env*")
+
+        assert pattern.regex.match("/home/user/.env.local")
+        assert not pattern.regex.match("/home/user/config.yml")
+
     def test_evaluate_multiple_patterns_first_match_wins(self):
         rule = PathAccessRule(
             id="test-rule",
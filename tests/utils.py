@@ -1,57 +1,87 @@
-"""Shared test utilities for creating mock contexts."""
+"""Shared test utilities for creating fake hook contexts."""
 
+import json
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 from unittest.mock import Mock
 
-import yaml
 from cchooks import PostToolUseContext, PreToolUseContext, SessionStartContext
 
 
-def pre_use_context(tool_name: str, **tool_input) -> Mock:
-    context = Mock(spec=PreToolUseContext)
-    context.hook_event_name = "PreToolUse"
-    context.tool_name = tool_name
-    context.tool_input = tool_input
-    context.output = Mock()
-    context.output.exit_success = Mock()
-    context.output.deny = Mock()
-    context.session_id = "test-session-123"
-    context._input_data = {"tool_name": tool_name, "tool_input": tool_input}
-    return context
+# Plain dataclasses registered as virtual subclasses of the cchooks contexts are far cheaper
+# to build than Mock(spec=...) and still satisfy isinstance checks and match statements
+@dataclass
+class FakeHookContext:
+    hook_event_name: str
+    _input_data: dict[str, Any]
+    session_id: str = "test-session-123"
+    output: Mock = field(default_factory=Mock)
 
 
-def pre_use_bash_context(command: str) -> Mock:
+@dataclass
+class FakePreToolUseContext(FakeHookContext):
+    tool_name: str = ""
+    tool_input: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class FakePostToolUseContext(FakeHookContext):
+    tool_name: str = ""
+    tool_input: dict[str, Any] = field(default_factory=dict)
+    tool_response: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class FakeSessionStartContext(FakeHookContext):
+    source: str = "startup"
+
+
+PreToolUseContext.register(FakePreToolUseContext)
+PostToolUseContext.register(FakePostToolUseContext)
+SessionStartContext.register(FakeSessionStartContext)
+
+
+def pre_use_context(tool_name: str, **tool_input) -> FakePreToolUseContext:
+    return FakePreToolUseContext(
+        hook_event_name="PreToolUse",
+        _input_data={"tool_name": tool_name, "tool_input": tool_input},
+        tool_name=tool_name,
+        tool_input=tool_input,
+    )
+
+
+def pre_use_bash_context(command: str) -> FakePreToolUseContext:
     return pre_use_context("Bash", command=command)
 
 
-def pre_use_read_context(file_path: str) -> Mock:
+def pre_use_read_context(file_path: str) -> FakePreToolUseContext:
     return pre_use_context("Read", file_path=file_path)
 
 
-def pre_use_write_context(file_path: str, tool_name: str = "Write") -> Mock:
+def pre_use_write_context(file_path: str, tool_name: str = "Write") -> FakePreToolUseContext:
     return pre_use_context(tool_name, file_path=file_path)
 
 
-def post_use_context(tool_name: str, tool_input: dict, tool_response: dict) -> Mock:
-    context = Mock(spec=PostToolUseContext)
-    context.hook_event_name = "PostToolUse"
-    context.tool_name = tool_name
-    context.tool_input = tool_input
-    context.tool_response = tool_response
-    context.output = Mock()
-    context.output.exit_success = Mock()
-    context.session_id = "test-session-123"
-    context._input_data = {
-        "tool_name": tool_name,
-        "tool_input": tool_input,
-        "tool_response": tool_response,
-    }
-    return context
+def post_use_context(
+    tool_name: str, tool_input: dict, tool_response: dict
+) -> FakePostToolUseContext:
+    return FakePostToolUseContext(
+        hook_event_name="PostToolUse",
+        _input_data={
+            "tool_name": tool_name,
+            "tool_input": tool_input,
+            "tool_response": tool_response,
+        },
+        tool_name=tool_name,
+        tool_input=tool_input,
+        tool_response=tool_response,
+    )
 
 
 def post_use_write_context(
     file_path: str, content: str = "file content", success: bool = True
-) -> Mock:
+) -> FakePostToolUseContext:
     return post_use_context(
         "Write",
         tool_input={"file_path": file_path, "content": content},
@@ -59,18 +89,17 @@ def post_use_write_context(
     )
 
 
-def session_start_context(source: str = "startup") -> Mock:
-    context = Mock(spec=SessionStartContext)
-    context.hook_event_name = "SessionStart"
-    context.source = source
-    context.session_id = "test-session-123"
-    context._input_data = {"source": source}
-    return context
+def session_start_context(source: str = "startup") -> FakeSessionStartContext:
+    return FakeSessionStartContext(
+        hook_event_name="SessionStart",
+        _input_data={"source": source},
+        source=source,
+    )
 
 
 def create_yaml_config(config_dir: Path, filename: str, config_data: dict) -> Path:
     config_path = config_dir / filename
     config_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(config_path, "w") as f:
-        yaml.dump(config_data, f)
+    # JSON is valid YAML and much cheaper to emit than yaml.dump
+    config_path.write_text(json.dumps(config_data))
     return config_path